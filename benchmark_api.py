@@ -0,0 +1,148 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, "summative/API")
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from starlette.requests import Request
+from app.main import (
+    app, build_model_info, build_root, model_version, payload_cache, predictor
+)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Runs in-process against summative/API/app; if the model has not been copied
+# to summative/API/app/models/best_model.pkl, the notebook's pickle is loaded instead
+FALLBACK_MODEL_PATH = os.path.join("summative", "linear_regression", "best_model.pkl")
+ITERATIONS = 5000
+BATCH_ITERATIONS = 1000
+
+def cpu_per_call(func, iterations):
+    """Process CPU time per call in microseconds (includes threadpool workers)"""
+    start = time.process_time()
+    for _ in range(iterations):
+        func()
+    return (time.process_time() - start) / iterations * 1e6
+
+def make_request(path, headers=None):
+    headers = headers or {}
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    })
+
+def call_asgi(loop, method, path, headers=None, body=b""):
+    """Send one request straight through the ASGI app; returns (status, headers, body)"""
+    headers = dict(headers or {})
+    if body:
+        headers["content-type"] = "application/json"
+        headers["content-length"] = str(len(body))
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": method,
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 12345),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    }
+    received = []
+    sent = {"status": None, "headers": {}, "body": b""}
+
+    async def receive():
+        if received:
+            return {"type": "http.disconnect"}
+        received.append(True)
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            sent["status"] = message["status"]
+            sent["headers"] = {k.decode(): v.decode() for k, v in message["headers"]}
+        elif message["type"] == "http.response.body":
+            sent["body"] += message.get("body", b"")
+
+    loop.run_until_complete(app(scope, receive, send))
+    return sent["status"], sent["headers"], sent["body"]
+
+def benchmark_cached_endpoints():
+    """Old rebuild-every-call handler path vs the cached payload path"""
+    for name, path, build in [("root", "/", build_root), ("model-info", "/model-info", build_model_info)]:
+        etag = payload_cache.get(name, model_version(), build).etag
+        fresh = make_request(path)
+        conditional = make_request(path, {"If-None-Match": etag})
+
+        # What FastAPI did for the old handlers: build the dict, encode it, render JSONResponse
+        rebuilt = cpu_per_call(lambda: JSONResponse(jsonable_encoder(build())), ITERATIONS)
+        cached = cpu_per_call(lambda: payload_cache.get(name, model_version(), build).response(fresh), ITERATIONS)
+        not_modified = cpu_per_call(
+            lambda: payload_cache.get(name, model_version(), build).response(conditional), ITERATIONS
+        )
+        body = payload_cache.get(name, model_version(), build).body
+        logger.info(
+            f"{path}: rebuilt {rebuilt:.1f} us, cached 200 {cached:.1f} us, "
+            f"cached 304 {not_modified:.1f} us ({len(body)} bytes -> 0 bytes on 304)"
+        )
+
+def benchmark_batch_compression(loop, rows):
+    """Bytes on the wire and server CPU for /predict/batch with gzip off and on"""
+    rng = random.Random(0)
+    body = json.dumps({"rows": [[rng.random() for _ in range(4)] for _ in range(rows)]}).encode()
+    results = {}
+    for encoding in ["identity", "gzip"]:
+        headers = {"Accept-Encoding": encoding}
+        status, response_headers, response_body = call_asgi(loop, "POST", "/predict/batch", headers, body)
+        if status != 200:
+            logger.error(f"Batch request failed: {status} {response_body[:200]}")
+            return False
+        cpu = cpu_per_call(
+            lambda: call_asgi(loop, "POST", "/predict/batch", headers, body), BATCH_ITERATIONS
+        )
+        results[encoding] = (len(response_body), response_headers.get("content-encoding", "identity"), cpu)
+
+    identity, gzip = results["identity"], results["gzip"]
+    logger.info(
+        f"/predict/batch ({rows} rows): identity {identity[0]} bytes, {identity[2]:.0f} us CPU; "
+        f"Accept-Encoding gzip -> {gzip[1]} {gzip[0]} bytes, {gzip[2]:.0f} us CPU "
+        f"({(gzip[2] - identity[2]) / identity[2] * 100:+.0f}% CPU)"
+    )
+    return True
+
+def run_all_benchmarks():
+    """Run all benchmarks"""
+    if not predictor.is_loaded:
+        predictor.model_path = FALLBACK_MODEL_PATH
+        predictor.load_model()
+    if not predictor.is_loaded:
+        logger.error("Cannot run benchmarks - model could not be loaded")
+        return
+
+    benchmark_cached_endpoints()
+
+    loop = asyncio.new_event_loop()
+    all_passed = True
+    for rows in [10, 100, 1000]:
+        all_passed = benchmark_batch_compression(loop, rows) and all_passed
+    loop.close()
+
+    if all_passed:
+        logger.info("\nAll benchmarks completed successfully!")
+    else:
+        logger.error("\nSome benchmarks failed!")
+
+if __name__ == "__main__":
+    run_all_benchmarks()
@@ -0,0 +1,56 @@
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# Payloads only change when a different model is loaded, so clients may reuse
+# them for a short while and revalidate with If-None-Match afterwards.
+CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+# Responses smaller than this are sent uncompressed; gzip overhead outweighs
+# the savings on tiny JSON bodies.
+GZIP_MINIMUM_SIZE = 1024
+GZIP_COMPRESS_LEVEL = 6
+
+
+class CachedPayload:
+    """JSON payload serialized once, with a validator for conditional GETs."""
+
+    def __init__(self, content: Any):
+        self.body = json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        # Weak ETag: the same entity may be sent gzip-encoded or not.
+        self.etag = f'W/"{hashlib.sha1(self.body).hexdigest()}"'
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        opaque = self.etag[2:]
+        return any(tag == self.etag or tag.removeprefix("W/") == opaque for tag in tags)
+
+    def response(self, request: Request) -> Response:
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+        if self.matches(request.headers.get("if-none-match")):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+class PayloadCache:
+    """Builds each payload once per model version and reuses it until the version changes."""
+
+    def __init__(self):
+        self._version: Optional[str] = None
+        self._payloads: Dict[str, CachedPayload] = {}
+
+    def get(self, name: str, version: str, build) -> CachedPayload:
+        if version != self._version:
+            self._version = version
+            self._payloads = {}
+        payload = self._payloads.get(name)
+        if payload is None:
+            payload = self._payloads[name] = CachedPayload(build())
+        return payload
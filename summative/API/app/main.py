@@ -1,7 +1,9 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field
 from typing import List, Dict
+from .http_cache import GZIP_COMPRESS_LEVEL, GZIP_MINIMUM_SIZE, PayloadCache
 from .models.model import TemperaturePredictor
 
 # Initialize predictor
@@ -21,8 +23,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
+# Compress large responses (e.g. batch predictions) for clients that accept gzip
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=GZIP_MINIMUM_SIZE,
+    compresslevel=GZIP_COMPRESS_LEVEL,
+)
+
+# Read-mostly payloads, rebuilt only when a different model is loaded
+payload_cache = PayloadCache()
+
 class PredictionInput(BaseModel):
     features: List[float]
 
@@ -33,6 +46,22 @@ class PredictionInput(BaseModel):
             }
         }
 
+# Upper bound on rows per /predict/batch request
+MAX_BATCH_ROWS = 1000
+
+class BatchPredictionInput(BaseModel):
+    rows: List[List[float]] = Field(
+        ...,
+        description=f"Up to {MAX_BATCH_ROWS} rows of 4 features each"
+    )
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "rows": [[0.2, 0.5, 0.7, 0.3], [0.5, 0.3, 0.2, 0.1]]
+            }
+        }
+
 FEATURE_NAMES = [
     "CO2 Concentration",
     "Solar Activity",
@@ -47,20 +76,48 @@ FEATURE_RANGES = {
     "Atmospheric Pressure": {"min": 0.0, "max": 1.0}
 }
 
-@app.get("/")
-def root() -> Dict:
+# (name, min, max, error message) per feature, in input order
+FEATURE_CHECKS = [
+    (
+        name,
+        FEATURE_RANGES[name]["min"],
+        FEATURE_RANGES[name]["max"],
+        f"{name} must be between {FEATURE_RANGES[name]['min']} and {FEATURE_RANGES[name]['max']}"
+    )
+    for name in FEATURE_NAMES
+]
+
+def model_version() -> str:
+    return predictor.version or "unloaded"
+
+def build_root() -> Dict:
     return {
         "message": "Welcome to the Global Temperature Anomaly Prediction API",
         "model_loaded": predictor.is_loaded,
         "version": "1.0.0",
+        "max_batch_rows": MAX_BATCH_ROWS,
         "endpoints": {
             "docs": "/docs",
             "predict": "/predict",
+            "predict-batch": "/predict/batch",
             "model-info": "/model-info",
             "validate": "/validate"
         }
     }
 
+def build_model_info() -> Dict:
+    return {
+        "feature_names": FEATURE_NAMES,
+        "feature_ranges": FEATURE_RANGES,
+        "model_loaded": predictor.is_loaded,
+        "output_description": "Temperature Anomaly (°C)",
+        "model_type": "Linear Regression"
+    }
+
+@app.get("/")
+def root(request: Request):
+    return payload_cache.get("root", model_version(), build_root).response(request)
+
 @app.post("/predict")
 def predict(input_data: PredictionInput):
     if len(input_data.features) != 4:
@@ -70,24 +127,36 @@ def predict(input_data: PredictionInput):
         prediction = predictor.predict(input_data.features)
         return {
             "prediction": prediction,
-            "input_features": {
-                FEATURE_NAMES[i]: input_data.features[i]
-                for i in range(len(FEATURE_NAMES))
-            },
+            "input_features": dict(zip(FEATURE_NAMES, input_data.features)),
+            "status": "success"
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/predict/batch")
+def predict_batch(input_data: BatchPredictionInput):
+    if not input_data.rows:
+        raise HTTPException(status_code=400, detail="At least one row is required")
+    if len(input_data.rows) > MAX_BATCH_ROWS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_ROWS} rows are allowed")
+    for i, row in enumerate(input_data.rows):
+        if len(row) != 4:
+            raise HTTPException(status_code=400, detail=f"Row {i}: exactly 4 features are required")
+    
+    try:
+        predictions = predictor.predict_batch(input_data.rows)
+        return {
+            "predictions": predictions,
+            "feature_names": FEATURE_NAMES,
+            "count": len(predictions),
             "status": "success"
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/model-info")
-def model_info():
-    return {
-        "feature_names": FEATURE_NAMES,
-        "feature_ranges": FEATURE_RANGES,
-        "model_loaded": predictor.is_loaded,
-        "output_description": "Temperature Anomaly (°C)",
-        "model_type": "Linear Regression"
-    }
+def model_info(request: Request):
+    return payload_cache.get("model-info", model_version(), build_model_info).response(request)
 
 @app.post("/validate")
 def validate_features(input_data: PredictionInput):
@@ -98,22 +167,15 @@ def validate_features(input_data: PredictionInput):
         }
     
     errors = []
-    for i, value in enumerate(input_data.features):
-        feature_name = FEATURE_NAMES[i]
-        range_info = FEATURE_RANGES[feature_name]
-        if value < range_info["min"] or value > range_info["max"]:
-            errors.append(
-                f"{feature_name} must be between {range_info['min']} and {range_info['max']}"
-            )
+    validated_features = {}
+    for value, (name, low, high, message) in zip(input_data.features, FEATURE_CHECKS):
+        in_range = low <= value <= high
+        if not in_range:
+            errors.append(message)
+        validated_features[name] = {"value": value, "in_range": in_range}
     
     return {
         "valid": len(errors) == 0,
         "errors": errors if errors else None,
-        "validated_features": {
-            FEATURE_NAMES[i]: {
-                "value": input_data.features[i],
-                "in_range": range_info["min"] <= input_data.features[i] <= range_info["max"]
-            }
-            for i, range_info in enumerate(FEATURE_RANGES.values())
-        }
-    } 
\ No newline at end of file
+        "validated_features": validated_features
+    }
@@ -1,3 +1,4 @@
+import hashlib
 import pickle
 import os
 import numpy as np
@@ -6,6 +7,7 @@ from typing import List
 class TemperaturePredictor:
     def __init__(self):
         self.model = None
+        self.version = None
         # Get the absolute path to the model file
         current_dir = os.path.dirname(os.path.abspath(__file__))
         self.model_path = os.path.join(current_dir, "best_model.pkl")
@@ -17,11 +19,15 @@ class TemperaturePredictor:
     def load_model(self):
         try:
             with open(self.model_path, "rb") as f:
-                self.model = pickle.load(f)
+                data = f.read()
+            self.model = pickle.loads(data)
+            # Identifies the loaded model so cached responses can be invalidated
+            self.version = hashlib.sha1(data).hexdigest()[:12]
             print(f"Successfully loaded model from {self.model_path}")
         except Exception as e:
             print(f"Error loading model from {self.model_path}: {e}")
             self.model = None
+            self.version = None
     
     def predict(self, features: List[float]) -> float:
         if self.model is None:
@@ -30,6 +36,12 @@ class TemperaturePredictor:
         features_array = np.array(features).reshape(1, -1)
         return float(self.model.predict(features_array)[0])
     
+    def predict_batch(self, rows: List[List[float]]) -> List[float]:
+        if self.model is None:
+            raise ValueError(f"Model not loaded. Tried path: {self.model_path}")
+        
+        return [float(p) for p in self.model.predict(np.array(rows))]
+    
     @property
     def is_loaded(self) -> bool:
         return self.model is not None 
\ No newline at end of file
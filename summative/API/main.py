@@ -1,10 +1,12 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field
 from typing import List
 import numpy as np
 import pickle
 import os
+from app.http_cache import GZIP_COMPRESS_LEVEL, GZIP_MINIMUM_SIZE, CachedPayload
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -20,13 +22,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
+)
+
+# Compress large responses for clients that accept gzip
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=GZIP_MINIMUM_SIZE,
+    compresslevel=GZIP_COMPRESS_LEVEL,
 )
 
 # Load model - look for model file in the same directory as main.py
 MODEL_PATH = os.path.join(os.path.dirname(__file__), "best_model.pkl")
 print(f"Looking for model at: {MODEL_PATH}")
 print(f"Current working directory: {os.getcwd()}")
-print(f"Directory contents: {os.listdir(os.path.dirname(__file__))}")
+DIRECTORY_CONTENTS = os.listdir(os.path.dirname(__file__))
+print(f"Directory contents: {DIRECTORY_CONTENTS}")
 
 try:
     with open(MODEL_PATH, "rb") as f:
@@ -56,21 +67,24 @@ class PredictionInput(BaseModel):
             }
         }
 
+# The model is loaded once at startup, so the root payload never changes
+ROOT_PAYLOAD = CachedPayload({
+    "message": "Welcome to the Global Temperature Anomaly Prediction API",
+    "model_loaded": model is not None,
+    "version": "1.0.0",
+    "model_path": MODEL_PATH,
+    "current_directory": os.getcwd(),
+    "directory_contents": DIRECTORY_CONTENTS,
+    "endpoints": {
+        "docs": "/docs",
+        "predict": "/predict"
+    }
+})
+
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint returning API information"""
-    return {
-        "message": "Welcome to the Global Temperature Anomaly Prediction API",
-        "model_loaded": model is not None,
-        "version": "1.0.0",
-        "model_path": MODEL_PATH,
-        "current_directory": os.getcwd(),
-        "directory_contents": os.listdir(os.path.dirname(__file__)),
-        "endpoints": {
-            "docs": "/docs",
-            "predict": "/predict"
-        }
-    }
+    return ROOT_PAYLOAD.response(request)
 
 @app.post("/predict")
 async def predict(input_data: PredictionInput):
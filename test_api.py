@@ -1,14 +1,19 @@
 import requests
 import json
 import logging
+import sys
 import time
 from requests.exceptions import RequestException
 
+sys.path.insert(0, "summative/API")
+from app.http_cache import CachedPayload
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# API endpoint
+# API endpoint (run `uvicorn wsgi:app` from summative/API; the batch and caching
+# tests need the model copied to summative/API/app/models/best_model.pkl)
 BASE_URL = "http://localhost:8000"
 
 def wait_for_server(max_retries=5, delay=2):
@@ -104,6 +109,93 @@ def test_invalid_input():
             logger.error(f"Response content: {e.response.text}")
         return False
 
+def test_cache_headers():
+    """Test ETag/Cache-Control headers and conditional GETs on cached endpoints"""
+    try:
+        for path in ["/", "/model-info"]:
+            response = requests.get(f"{BASE_URL}{path}")
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            if etag is None or "Cache-Control" not in response.headers:
+                logger.error(f"{path} is missing ETag or Cache-Control: {response.headers}")
+                return False
+
+            response = requests.get(f"{BASE_URL}{path}", headers={"If-None-Match": etag})
+            if response.status_code != 304 or response.content:
+                logger.error(f"{path} with matching ETag: expected empty 304, got {response.status_code}")
+                return False
+
+            response = requests.get(f"{BASE_URL}{path}", headers={"If-None-Match": '"stale"'})
+            if response.status_code != 200:
+                logger.error(f"{path} with stale ETag: expected 200, got {response.status_code}")
+                return False
+        logger.info("Cache headers test successful")
+        return True
+    except Exception as e:
+        logger.error(f"Cache headers test failed: {e}")
+        return False
+
+def test_etag_matching():
+    """Test If-None-Match parsing: weak/strong tags, lists and *"""
+    payload = CachedPayload({"status": "ok"})
+    opaque = payload.etag[2:]
+    cases = [
+        (payload.etag, True),
+        (opaque, True),
+        (f'"other", {payload.etag}', True),
+        (f'W/"other" , {opaque}', True),
+        ("*", True),
+        ('"other"', False),
+        ('W/"other"', False),
+        ("", False),
+        (None, False),
+    ]
+    for header, expected in cases:
+        if payload.matches(header) != expected:
+            logger.error(f"ETag matching failed for {header!r}: expected {expected}")
+            return False
+    logger.info("ETag matching test successful")
+    return True
+
+def test_batch_invalid_input():
+    """Test the batch endpoint rejects empty, malformed and oversized batches"""
+    cases = [
+        ("empty rows", {"rows": []}),
+        ("short row", {"rows": [[0.5, 0.3, 0.2, 0.1], [0.5, 0.3]]}),
+        ("too many rows", {"rows": [[0.5, 0.3, 0.2, 0.1]] * 1001}),
+    ]
+    try:
+        for name, test_data in cases:
+            response = requests.post(f"{BASE_URL}/predict/batch", json=test_data)
+            if response.status_code != 400:
+                logger.error(f"Batch {name}: expected 400, got {response.status_code}")
+                return False
+        logger.info("Batch invalid input test successful")
+        return True
+    except Exception as e:
+        logger.error(f"Batch invalid input test failed: {e}")
+        return False
+
+def test_batch_compression():
+    """Test large batch responses are gzipped and small ones are not"""
+    try:
+        for rows, expected in [(1000, "gzip"), (1, None)]:
+            response = requests.post(
+                f"{BASE_URL}/predict/batch",
+                json={"rows": [[0.5, 0.3, 0.2, 0.1]] * rows},
+                headers={"Accept-Encoding": "gzip"}
+            )
+            response.raise_for_status()
+            encoding = response.headers.get("Content-Encoding")
+            if encoding != expected or len(response.json()["predictions"]) != rows:
+                logger.error(f"Batch of {rows}: expected Content-Encoding {expected}, got {encoding}")
+                return False
+        logger.info("Batch compression test successful")
+        return True
+    except Exception as e:
+        logger.error(f"Batch compression test failed: {e}")
+        return False
+
 def run_all_tests():
     """Run all tests"""
     logger.info("Starting API tests...")
@@ -116,7 +208,11 @@ def run_all_tests():
     tests = [
         ("Root endpoint", test_root_endpoint),
         ("Prediction endpoint", test_predict_endpoint),
-        ("Invalid input", test_invalid_input)
+        ("Invalid input", test_invalid_input),
+        ("Cache headers", test_cache_headers),
+        ("ETag matching", test_etag_matching),
+        ("Batch invalid input", test_batch_invalid_input),
+        ("Batch compression", test_batch_compression)
     ]
     
     all_passed = True